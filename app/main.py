@@ -1,18 +1,33 @@
 import asyncio
 from contextlib import asynccontextmanager
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 from urllib.parse import quote
 
+from beanie import UpdateResponse
 from bson import ObjectId
+from bson.errors import InvalidId
 from fastapi import (FastAPI, File, HTTPException, UploadFile,
-                     Request, Query, Form)
+                     Request, Response, Query, Form)
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
-
-from app.database import gridfs_bucket, init_db
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from gridfs.errors import NoFile
+from motor.motor_asyncio import AsyncIOMotorGridIn
+from pydantic import BaseModel, Field
+from python_multipart.exceptions import FormParserError
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from app.database import GRIDFS_CHUNK_BYTES, gridfs_bucket, init_db
 from app.models.file import GridFSFile, FileStatus
 
+# Number of chunks streamed between client disconnect checks
+DISCONNECT_CHECK_INTERVAL = 32
+
+# Minimum size of each body message sent while streaming a download
+STREAM_BUFFER_BYTES = 1024 * 1024
+
+# Maximum number of files a bulk upload writes to GridFS at once
+BULK_UPLOAD_CONCURRENCY = 8
+
 
 # Pydantic models for request/response
 class FileUploadResponse(BaseModel):
@@ -26,13 +41,29 @@ class FileUploadResponse(BaseModel):
 class FileListResponse(BaseModel):
     id: str
     filename: str
-    content_type: Optional[str]
-    upload_date: Any
-    file_size: Optional[int]
-    status: FileStatus
-    owner_id: Optional[str]
-    tags: List[str]
-    description: Optional[str]
+    content_type: Optional[str] = None
+    upload_date: Any = None
+    file_size: Optional[int] = None
+    status: FileStatus = FileStatus.ACTIVE
+    owner_id: Optional[str] = None
+    tags: List[str] = Field(default_factory=list)
+    description: Optional[str] = None
+
+    class Settings:
+        # Used when querying GridFSFile with this as projection_model, so only
+        # the listed fields come back from fs.files. Fields missing from a
+        # document fall back to the same defaults as GridFSFile.
+        projection = {
+            "id": {"$toString": "$_id"},
+            "filename": 1,
+            "content_type": "$contentType",
+            "upload_date": "$uploadDate",
+            "file_size": "$length",
+            "status": 1,
+            "owner_id": 1,
+            "tags": 1,
+            "description": 1,
+        }
 
 
 class FileUpdateRequest(BaseModel):
@@ -41,6 +72,71 @@ class FileUpdateRequest(BaseModel):
     description: Optional[str] = None
 
 
+def parse_oid(file_id: str) -> ObjectId:
+    """Parse a file ID into an ObjectId, raising a 400 if it is malformed."""
+    try:
+        return ObjectId(file_id)
+    except (InvalidId, TypeError):
+        raise HTTPException(400, "Invalid file ID")
+
+
+def parse_range(range_header: Optional[str], file_size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single-range ``Range: bytes=...`` header into inclusive offsets.
+
+    Returns None when the whole file should be sent (no header, a malformed
+    or reversed one, or multiple ranges) and raises a 416 when the range starts
+    past the end of the file or asks for an empty suffix.
+    """
+    if not range_header or not file_size:
+        return None
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_str, sep, end_str = spec.strip().partition("-")
+    if not sep or not (start_str or end_str):
+        return None
+    if (start_str and not start_str.isdigit()) or (end_str and not end_str.isdigit()):
+        return None
+
+    if start_str:
+        start = int(start_str)
+        end = int(end_str) if end_str else max(start, file_size - 1)
+        if end < start:
+            # Invalid under RFC 9110, so the header is ignored
+            return None
+        satisfiable = start < file_size
+    else:
+        # Suffix range, e.g. "bytes=-500" for the last 500 bytes
+        suffix_length = int(end_str)
+        start = max(file_size - suffix_length, 0)
+        end = file_size - 1
+        satisfiable = suffix_length > 0
+    if not satisfiable:
+        raise HTTPException(
+            416, "Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{file_size}"},
+        )
+    return start, min(end, file_size - 1)
+
+
+def content_disposition(filename: str) -> str:
+    """Build an attachment Content-Disposition header for a filename."""
+    if filename.isascii() and filename.isprintable():
+        # Quoted-string, so spaces and quotes in the name survive
+        escaped_filename = filename.replace("\\", "\\\\").replace('"', '\\"')
+        return f'attachment; filename="{escaped_filename}"'
+    else:
+        # Use RFC 5987 encoding for non-ASCII characters
+        encoded_filename = quote(filename.encode('utf-8'))
+        return f"attachment; filename*=UTF-8''{encoded_filename}"
+
+
+async def iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    """Yield an uploaded file's content in GridFS-sized chunks."""
+    while chunk := await file.read(GRIDFS_CHUNK_BYTES):
+        yield chunk
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context for startup and shutdown tasks"""
@@ -51,7 +147,17 @@ async def lifespan(app: FastAPI):
     # e.g., closing database connections
 
 
-app = FastAPI(title="GridFSFile File Storage API", lifespan=lifespan)
+# Newer FastAPI releases serialize response models straight to JSON bytes with
+# Pydantic and mark ORJSONResponse deprecated; only older ones need orjson
+DEFAULT_RESPONSE_CLASS = (
+    JSONResponse if hasattr(ORJSONResponse, "__deprecated__") else ORJSONResponse
+)
+
+app = FastAPI(
+    title="GridFSFile File Storage API",
+    lifespan=lifespan,
+    default_response_class=DEFAULT_RESPONSE_CLASS,
+)
 
 # CORS
 app.add_middleware(
@@ -63,151 +169,426 @@ app.add_middleware(
 )
 
 
-@app.post("/upload", response_model=FileUploadResponse)
-async def upload_file(
-    file: UploadFile = File(...),
-    owner_id: Optional[str] = Form(None),
-    tags: Optional[str] = Form(None),  # Comma-separated tags
-    description: Optional[str] = Form(None)
-) -> FileUploadResponse:
-    """Upload a new file (image or video) to GridFS storage."""
-    if not file.content_type or not file.content_type.startswith(("image/", "video/")):
+def check_media_type(content_type: Optional[str]) -> None:
+    """Reject uploads that are not images or videos."""
+    if not content_type or not content_type.startswith(("image/", "video/")):
         raise HTTPException(400, "Only images and videos are allowed")
 
-    content_type = file.content_type
-    filename = file.filename or "unnamed_file"
-
-    # Read file content to get size
-    file_content = await file.read()
-    file_size = len(file_content)
 
-    # Reset file pointer
-    await file.seek(0)
-
-    # Parse tags
-    tag_list = []
-    if tags:
-        tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
-
-    # Upload to GridFS
-    file_id = await gridfs_bucket.upload_from_stream(
-        filename,
-        file.file,
-        metadata={
+def parse_tags(tags: Optional[str]) -> List[str]:
+    """Split a comma-separated tags form field into a list."""
+    if not tags:
+        return []
+    return [tag.strip() for tag in tags.split(",") if tag.strip()]
+
+
+def file_fields(
+    filename: str,
+    content_type: str,
+    owner_id: Optional[str],
+    tag_list: List[str],
+    description: Optional[str],
+    source: str,
+) -> Dict[str, Any]:
+    """Fields we store on a file's fs.files document alongside GridFS's own."""
+    return {
+        # Lowercased so list filters can use plain index range/equality scans
+        "contentType": content_type.lower(),
+        "owner_id": owner_id,
+        "status": FileStatus.ACTIVE,
+        "tags": tag_list,
+        "description": description,
+        "metadata": {
             "content_type": content_type,
             "original_name": filename,
             "owner_id": owner_id,
-            "file_size": file_size
+            "uploaded_by": "api",
+            "source": source,
         },
-    )
+    }
 
-    # Save metadata in MongoDB collection
-    gridfs_file = GridFSFile(
-        filename=filename,
-        content_type=content_type,
-        file_id=str(file_id),
-        owner_id=owner_id,
-        status=FileStatus.ACTIVE,
-        file_size=file_size,
-        tags=tag_list,
-        description=description,
-        metadata={"uploaded_by": "api", "source": "upload_endpoint"},
-    )
 
-    await gridfs_file.insert()
+def open_gridfs_upload(filename: str) -> AsyncIOMotorGridIn:
+    """Start a GridFS upload; its fields are attached by close_gridfs_upload."""
+    return gridfs_bucket.open_upload_stream(filename, chunk_size_bytes=GRIDFS_CHUNK_BYTES)
+
+
+async def close_gridfs_upload(grid_in: AsyncIOMotorGridIn, fields: Dict[str, Any]) -> None:
+    """Attach our fields to a GridFS upload and close it.
+
+    Setting them before close() means they go out in the same fs.files
+    insert as GridFS's own fields, so a file never exists without them.
+    """
+    try:
+        for name, value in fields.items():
+            await grid_in.set(name, value)
+    except Exception:
+        await grid_in.abort()
+        raise
+    await grid_in.close()
+
+
+async def write_to_gridfs(
+    file: UploadFile,
+    owner_id: Optional[str],
+    tag_list: List[str],
+    description: Optional[str],
+    source: str,
+) -> Tuple[ObjectId, int]:
+    """Stream an upload into GridFS with our fields, returning the new file's ID and size."""
+    filename = file.filename or "unnamed_file"
+
+    # Stream straight into GridFS, counting bytes as we go instead of
+    # buffering the whole file up front just to learn its size
+    grid_in = open_gridfs_upload(filename)
+    file_size = 0
+    try:
+        async for chunk in iter_upload(file):
+            file_size += len(chunk)
+            await grid_in.write(chunk)
+    except Exception:
+        await grid_in.abort()
+        raise
+    await close_gridfs_upload(
+        grid_in, file_fields(filename, file.content_type, owner_id, tag_list, description, source)
+    )
+    return grid_in._id, file_size
+
+
+class GridFSMultipartUpload:
+    """Streams a single-file multipart/form-data body straight into GridFS.
+
+    The file part is written to GridFS as it is parsed instead of being
+    spooled to a temporary file first. Only the form fields in
+    ``field_names`` are collected, as plain strings; any others are skipped
+    without being buffered.
+    """
+
+    field_names = frozenset({"owner_id", "tags", "description"})
+    max_field_size = 64 * 1024
+
+    def __init__(self, request: Request, source: str):
+        self.request = request
+        self.source = source
+        self.fields: Dict[str, str] = {}
+        self.filename: Optional[str] = None
+        self.content_type: Optional[str] = None
+        self.file_size = 0
+        self.grid_in = None
+        self._header_name = b""
+        self._header_value = b""
+        self._part_headers: Dict[bytes, bytes] = {}
+        self._part_name: Optional[str] = None
+        self._part_data = bytearray()
+        self._in_file = False
+        self._pending = bytearray()
+        self._finished = False
+
+    def on_part_begin(self) -> None:
+        self._part_headers = {}
+        self._part_name = None
+        self._part_data.clear()
+        self._in_file = False
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._part_headers[self._header_name.lower()] = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._part_headers.get(b"content-disposition", b""))
+        if b"name" not in options:
+            raise HTTPException(400, "Multipart part is missing a field name")
+        self._part_name = options[b"name"].decode("utf-8", "replace")
+
+        if b"filename" not in options:
+            if self._part_name not in self.field_names:
+                self._part_name = None
+            return
+        if self._part_name != "file":
+            # Ignore any other file parts
+            self._part_name = None
+            return
+        if self.grid_in is not None:
+            raise HTTPException(400, "Only one file can be uploaded")
+
+        content_type = self._part_headers.get(b"content-type", b"").decode("latin-1")
+        check_media_type(content_type)
+        self.content_type = content_type
+        self.filename = options[b"filename"].decode("utf-8", "replace") or "unnamed_file"
+        self.grid_in = open_gridfs_upload(self.filename)
+        self._in_file = True
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file:
+            # Written to GridFS after the parser returns, since that needs await
+            self._pending += data[start:end]
+            self.file_size += end - start
+        elif self._part_name is not None:
+            if len(self._part_data) + end - start > self.max_field_size:
+                raise HTTPException(400, f"Form field {self._part_name!r} is too large")
+            self._part_data += data[start:end]
+
+    def on_part_end(self) -> None:
+        if not self._in_file and self._part_name is not None:
+            self.fields[self._part_name] = self._part_data.decode("utf-8", "replace")
+        self._in_file = False
+
+    def on_end(self) -> None:
+        self._finished = True
+
+    async def flush(self) -> None:
+        """Write the buffered file data to GridFS."""
+        if self._pending:
+            await self.grid_in.write(bytes(self._pending))
+            self._pending.clear()
+
+    async def parse(self) -> None:
+        """Consume the request body, streaming the file part into GridFS.
+
+        The GridFS upload is left open so the caller can attach the form
+        fields to it before closing.
+        """
+        content_type, params = parse_options_header(self.request.headers.get("content-type", ""))
+        if content_type != b"multipart/form-data" or b"boundary" not in params:
+            raise HTTPException(400, "Expected a multipart/form-data request")
+
+        parser = MultipartParser(params[b"boundary"], {
+            "on_part_begin": self.on_part_begin,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+            "on_end": self.on_end,
+        })
+        try:
+            async for chunk in self.request.stream():
+                parser.write(chunk)
+                # Body messages are small, so batch them into GridFS-sized
+                # writes rather than paying an executor hop for each one
+                if len(self._pending) >= GRIDFS_CHUNK_BYTES:
+                    await self.flush()
+            parser.finalize()
+            # finalize() doesn't check that the closing boundary was seen
+            if not self._finished:
+                raise FormParserError("Multipart body ended early")
+            await self.flush()
+        except Exception as e:
+            if self.grid_in is not None:
+                await self.grid_in.abort()
+            if isinstance(e, FormParserError):
+                raise HTTPException(400, "Invalid multipart data")
+            raise
+
+        if self.grid_in is None:
+            raise HTTPException(422, "No file was uploaded")
+
+
+@app.post(
+    "/upload",
+    response_model=FileUploadResponse,
+    openapi_extra={"requestBody": {"required": True, "content": {"multipart/form-data": {"schema": {
+        "type": "object",
+        "required": ["file"],
+        "properties": {
+            "file": {"type": "string", "format": "binary"},
+            "owner_id": {"type": "string"},
+            "tags": {"type": "string", "description": "Comma-separated tags"},
+            "description": {"type": "string"},
+        },
+    }}}}},
+)
+async def upload_file(request: Request) -> FileUploadResponse:
+    """Upload a new file (image or video) to GridFS storage."""
+    # Parse the multipart body ourselves so the file streams into GridFS
+    # as it arrives rather than being spooled to disk by the form parser
+    upload = GridFSMultipartUpload(request, "upload_endpoint")
+    await upload.parse()
+
+    owner_id = upload.fields.get("owner_id") or None
+    tag_list = parse_tags(upload.fields.get("tags"))
+    description = upload.fields.get("description") or None
+    file_id = upload.grid_in._id
+
+    # Every form field has been read by now, so our fields (and the owner in
+    # the GridFS metadata) go into the same fs.files insert as the file itself
+    await close_gridfs_upload(upload.grid_in, file_fields(
+        upload.filename, upload.content_type, owner_id, tag_list, description, upload.source
+    ))
 
     return FileUploadResponse(
         file_id=str(file_id),
-        filename=filename,
-        file_size=file_size,
-        status=gridfs_file.status.value,
+        filename=upload.filename,
+        file_size=upload.file_size,
+        status=FileStatus.ACTIVE.value,
         owner_id=owner_id
     )
 
 
-@app.get("/files/{file_id}")
-async def get_file(file_id: str, request: Request):
-    if not ObjectId.is_valid(file_id):
-        raise HTTPException(400, "Invalid file ID")
-
-    oid = ObjectId(file_id)
-
-    # Use find_one to get a single document, or iterate through the cursor
-    cursor = gridfs_bucket.find({"_id": oid})
-    file_doc = None
-    async for doc in cursor:
-        file_doc = doc
-        break
+@app.post("/upload/bulk", response_model=List[FileUploadResponse])
+async def upload_bulk(
+    files: List[UploadFile] = File(...),
+    owner_id: Optional[str] = Form(None),
+    tags: Optional[str] = Form(None),  # Comma-separated tags, applied to every file
+    description: Optional[str] = Form(None)
+) -> List[FileUploadResponse]:
+    """Upload several files (images or videos) to GridFS storage concurrently."""
+    for file in files:
+        check_media_type(file.content_type)
+    tag_list = parse_tags(tags)
+
+    # Bound concurrent GridFS writes so one batch can't drain the connection pool
+    semaphore = asyncio.Semaphore(BULK_UPLOAD_CONCURRENCY)
+
+    async def upload_one(file: UploadFile) -> Tuple[ObjectId, int]:
+        async with semaphore:
+            return await write_to_gridfs(
+                file, owner_id, tag_list, description, "bulk_upload_endpoint"
+            )
+
+    results = await asyncio.gather(
+        *(upload_one(file) for file in files), return_exceptions=True
+    )
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        # Don't leave half a batch behind
+        await asyncio.gather(
+            *(gridfs_bucket.delete(r[0]) for r in results if not isinstance(r, BaseException)),
+            return_exceptions=True,
+        )
+        raise errors[0]
+
+    return [
+        FileUploadResponse(
+            file_id=str(file_id),
+            filename=file.filename or "unnamed_file",
+            file_size=file_size,
+            status=FileStatus.ACTIVE.value,
+            owner_id=owner_id
+        )
+        for file, (file_id, file_size) in zip(files, results)
+    ]
 
-    if not file_doc:
-        raise HTTPException(404, "File Not Found in GridFS")
 
-    filename = file_doc.filename or "file"
-    content_type = (
-        file_doc.metadata.get("content_type", "video/mp4")
-        if file_doc.metadata
-        else "video/mp4"
-    )
-    file_size = file_doc.length
+@app.get("/files/{file_id}")
+async def get_file(file_id: str, request: Request):
+    oid = parse_oid(file_id)
 
     try:
-        grid_out = await asyncio.wait_for(
-            gridfs_bucket.open_download_stream(oid), timeout=30.0
-        )
-    except asyncio.TimeoutError:
+        async with asyncio.timeout(30.0):
+            grid_out = await gridfs_bucket.open_download_stream(oid)
+    except NoFile:
+        raise HTTPException(404, "File Not Found in GridFS")
+    except TimeoutError:
         raise HTTPException(504, "Timeout File too large or server busy")
     except Exception as e:
         raise HTTPException(400, f"Stream error: {str(e)}")
 
+    # The GridOut already carries the file document, no separate lookup needed
+    filename = grid_out.filename or "file"
+    content_type = (grid_out.metadata or {}).get("content_type", "video/mp4")
+    file_size = grid_out.length
+
+    try:
+        byte_range = parse_range(request.headers.get("range"), file_size)
+    except HTTPException:
+        grid_out.close()
+        raise
+    start, end = byte_range or (0, file_size - 1)
+    if start:
+        grid_out.seek(start)
+
     async def stream_file():
         try:
-            while True:
-                chunk = await grid_out.readchunk()
-                if not chunk:
+            i = 0
+            remaining = end - start + 1
+            buffer = bytearray()
+            async for chunk in grid_out:
+                # Trim the final chunk to the end of the requested range
+                if len(chunk) > remaining:
+                    chunk = chunk[:remaining]
+                remaining -= len(chunk)
+
+                # Coalesce small GridFS chunks so each ASGI body message
+                # (and its send) carries up to STREAM_BUFFER_BYTES
+                if not buffer and len(chunk) >= STREAM_BUFFER_BYTES:
+                    yield chunk
+                else:
+                    buffer += chunk
+                    if len(buffer) >= STREAM_BUFFER_BYTES:
+                        yield bytes(buffer)
+                        buffer.clear()
+                if remaining <= 0:
                     break
-                yield chunk
 
-                if await request.is_disconnected():
+                # Polling for disconnects is not free, so only check every few chunks
+                i += 1
+                if i % DISCONNECT_CHECK_INTERVAL == 0 and await request.is_disconnected():
                     print("Client Disconnected during download")
-                    break
+                    return
+            if buffer:
+                yield bytes(buffer)
         except Exception as e:
             print(f"Stream error {e}")
         finally:
             grid_out.close()
 
-    # Properly encode filename for Content-Disposition header
-    # Use RFC 5987 encoding for Unicode filenames
-    try:
-        # Try ASCII first
-        safe_filename = filename.encode('ascii').decode('ascii')
-        content_disposition = f"attachment; filename={safe_filename}"
-    except UnicodeEncodeError:
-        # Use RFC 5987 encoding for non-ASCII characters
-        encoded_filename = quote(filename.encode('utf-8'))
-        content_disposition = f"attachment; filename*=UTF-8''{encoded_filename}"
-
     headers = {
-        "Content-Disposition": content_disposition,
+        "Content-Disposition": content_disposition(filename),
         "Accept-Ranges": "bytes",
-        "Content-Length": str(file_size),
+        "Content-Length": str(end - start + 1),
         "Cache-Control": "public, max-age=3600",
     }
 
+    if byte_range:
+        headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+        return StreamingResponse(
+            stream_file(), status_code=206, media_type=content_type, headers=headers
+        )
+
     return StreamingResponse(stream_file(), media_type=content_type, headers=headers)
 
 
+@app.head("/files/{file_id}")
+async def head_file(file_id: str) -> Response:
+    """Return a file's download headers without opening a GridFS stream."""
+    oid = parse_oid(file_id)
+
+    file_doc = await GridFSFile.get_pymongo_collection().find_one(
+        {"_id": oid}, {"length": 1, "filename": 1, "metadata.content_type": 1}
+    )
+    if not file_doc:
+        raise HTTPException(404, "File Not Found in GridFS")
+
+    content_type = (file_doc.get("metadata") or {}).get("content_type", "video/mp4")
+    return Response(status_code=200, media_type=content_type, headers={
+        "Content-Disposition": content_disposition(file_doc.get("filename") or "file"),
+        "Accept-Ranges": "bytes",
+        "Content-Length": str(file_doc["length"]),
+        "Cache-Control": "public, max-age=3600",
+    })
+
+
 @app.get("/files/{file_id}/info", response_model=FileListResponse)
 async def get_file_info(file_id: str):
     """Get file metadata without downloading the file."""
-    if not ObjectId.is_valid(file_id):
-        raise HTTPException(400, "Invalid file ID")
+    oid = parse_oid(file_id)
 
     # Find file metadata in our collection
-    file_doc = await GridFSFile.find_one({"file_id": file_id})
+    file_doc = await GridFSFile.find_one({"_id": oid})
     if not file_doc:
         raise HTTPException(404, "File not found")
 
-    return FileListResponse(
+    # Fields come from an already validated document, skip re-validating them
+    return FileListResponse.model_construct(
         id=str(file_doc.id),
         filename=file_doc.filename,
         content_type=file_doc.content_type,
@@ -223,13 +604,7 @@ async def get_file_info(file_id: str):
 @app.put("/files/{file_id}", response_model=FileListResponse)
 async def update_file(file_id: str, update_data: FileUpdateRequest):
     """Update file metadata (status, tags, description)."""
-    if not ObjectId.is_valid(file_id):
-        raise HTTPException(400, "Invalid file ID")
-
-    # Find the file
-    file_doc = await GridFSFile.find_one({"file_id": file_id})
-    if not file_doc:
-        raise HTTPException(404, "File not found")
+    oid = parse_oid(file_id)
 
     # Update only provided fields
     update_dict = {}
@@ -240,12 +615,18 @@ async def update_file(file_id: str, update_data: FileUpdateRequest):
     if update_data.description is not None:
         update_dict["description"] = update_data.description
 
+    query = GridFSFile.find_one({"_id": oid})
     if update_dict:
-        await file_doc.update({"$set": update_dict})
-        # Refresh the document
-        await file_doc.refresh()
+        # Update and fetch the new document in a single round-trip
+        file_doc = await query.update(
+            {"$set": update_dict}, response_type=UpdateResponse.NEW_DOCUMENT
+        )
+    else:
+        file_doc = await query
+    if not file_doc:
+        raise HTTPException(404, "File not found")
 
-    return FileListResponse(
+    return FileListResponse.model_construct(
         id=str(file_doc.id),
         filename=file_doc.filename,
         content_type=file_doc.content_type,
@@ -261,28 +642,23 @@ async def update_file(file_id: str, update_data: FileUpdateRequest):
 @app.delete("/files/{file_id}")
 async def delete_file(file_id: str, permanent: bool = Query(False, description="Permanently delete or just mark as deleted")):
     """Delete a file (soft delete by default, permanent if specified)."""
-    if not ObjectId.is_valid(file_id):
-        raise HTTPException(400, "Invalid file ID")
-
-    # Find the file
-    file_doc = await GridFSFile.find_one({"file_id": file_id})
-    if not file_doc:
-        raise HTTPException(404, "File not found")
+    oid = parse_oid(file_id)
 
     if permanent:
-        # Delete from GridFS
-        oid = ObjectId(file_id)
+        # Metadata lives on the fs.files document, so deleting from GridFS
+        # removes both the file and its metadata
         try:
             await gridfs_bucket.delete(oid)
-        except Exception as e:
-            print(f"Error deleting from GridFS: {e}")
-
-        # Delete from our collection
-        await file_doc.delete()
+        except NoFile:
+            raise HTTPException(404, "File not found")
         return {"message": "File permanently deleted", "file_id": file_id}
     else:
         # Soft delete - just mark as deleted
-        await file_doc.update({"$set": {"status": FileStatus.DELETED}})
+        result = await GridFSFile.find_one({"_id": oid}).update(
+            {"$set": {"status": FileStatus.DELETED}}
+        )
+        if not result.matched_count:
+            raise HTTPException(404, "File not found")
         return {"message": "File marked as deleted", "file_id": file_id, "status": "deleted"}
 
 
@@ -290,7 +666,7 @@ async def delete_file(file_id: str, permanent: bool = Query(False, description="
 async def list_files(
     owner_id: Optional[str] = Query(None, description="Filter by owner ID"),
     status: Optional[FileStatus] = Query(None, description="Filter by file status"),
-    content_type: Optional[str] = Query(None, description="Filter by content type (e.g., 'image/', 'video/')"),
+    content_type: Optional[str] = Query(None, description="Filter by content type: a prefix ending in '/' (e.g., 'image/', 'video/') or an exact type"),
     tags: Optional[str] = Query(None, description="Filter by tags (comma-separated)"),
     limit: int = Query(50, ge=1, le=1000, description="Maximum number of files to return"),
     skip: int = Query(0, ge=0, description="Number of files to skip (for pagination)")
@@ -307,31 +683,26 @@ async def list_files(
         filter_query["status"] = status
 
     if content_type:
-        filter_query["content_type"] = {"$regex": f"^{content_type}", "$options": "i"}
+        content_type = content_type.lower()
+        if content_type.endswith("/"):
+            # Prefix match as an index range scan, e.g. "image/" <= ct < "image0"
+            upper_bound = content_type[:-1] + chr(ord(content_type[-1]) + 1)
+            filter_query["contentType"] = {"$gte": content_type, "$lt": upper_bound}
+        else:
+            filter_query["contentType"] = content_type
 
     # Parse tags filter
-    if tags:
-        tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
-        if tag_list:
-            filter_query["tags"] = {"$in": tag_list}
-
-    # Query the database collection (not GridFS directly)
-    files_cursor = GridFSFile.find(filter_query).skip(skip).limit(limit)
-    files = await files_cursor.to_list()
-
-    # Convert to response format
-    response_files = []
-    for file_doc in files:
-        response_files.append(FileListResponse(
-            id=str(file_doc.id),
-            filename=file_doc.filename,
-            content_type=file_doc.content_type,
-            upload_date=file_doc.upload_date,
-            file_size=file_doc.file_size,
-            status=file_doc.status,
-            owner_id=file_doc.owner_id,
-            tags=file_doc.tags,
-            description=file_doc.description
-        ))
-
-    return response_files
+    tag_list = parse_tags(tags)
+    if tag_list:
+        filter_query["tags"] = {"$in": tag_list}
+
+    # Query the GridFS files collection, newest first. uploadDate isn't unique
+    # (bulk uploads often share a millisecond), so _id breaks ties and keeps
+    # skip/limit pages from repeating or dropping files
+    files_cursor = (
+        GridFSFile.find(filter_query, projection_model=FileListResponse)
+        .sort("-uploadDate", "-_id")
+        .skip(skip)
+        .limit(limit)
+    )
+    return await files_cursor.to_list()
@@ -15,24 +15,32 @@ class FileStatus(str, Enum):
 
 
 class GridFSFile(Document):
+    """File document stored directly in GridFS's own ``fs.files`` collection.
+
+    GridFS writes ``filename``, ``length``, ``uploadDate`` and ``metadata``;
+    the remaining fields are set on the upload before it is closed, so they
+    go into the same insert. ``content_type`` maps onto GridFS's own
+    ``contentType`` field, which is what Motor stores it as.
+    """
     filename: str
-    content_type: str
-    upload_date: datetime = Field(default_factory=datetime.now)
-    file_id: str
+    content_type: Optional[str] = Field(default=None, alias="contentType")
+    upload_date: datetime = Field(default_factory=datetime.now, alias="uploadDate")
     owner_id: Optional[str] = Field(default=None, description="ID of the user who uploaded the file")
     status: FileStatus = Field(default=FileStatus.ACTIVE, description="Status of the file")
-    file_size: Optional[int] = Field(default=None, description="Size of the file in bytes")
+    file_size: Optional[int] = Field(default=None, alias="length", description="Size of the file in bytes")
     tags: List[str] = Field(default_factory=list, description="Tags for categorizing files")
     description: Optional[str] = Field(default=None, description="Optional description of the file")
     metadata: Optional[dict] = Field(default_factory=dict)
 
     class Settings:
-        name = "gridfs_files"
+        name = "fs.files"
         indexes = [
             "owner_id",
             "status",
-            "content_type",
-            "upload_date",
+            "contentType",
+            [("uploadDate", -1), ("_id", -1)],  # Sort for unfiltered listings
             [("owner_id", 1), ("status", 1)],  # Compound index
-            [("content_type", 1), ("status", 1)],  # Compound index
+            [("contentType", 1), ("status", 1)],  # Compound index
+            [("status", 1), ("uploadDate", -1), ("_id", -1)],  # Filter + sort for listings
+            [("owner_id", 1), ("uploadDate", -1), ("_id", -1)],  # Filter + sort for listings
         ]
@@ -0,0 +1,54 @@
+import pytest
+from fastapi import HTTPException
+
+from app.main import parse_range
+
+FILE_SIZE = 1000
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("bytes=0-99", (0, 99)),
+        ("bytes=100-", (100, 999)),  # Open-ended
+        ("bytes=-100", (900, 999)),  # Suffix
+        ("bytes=-5000", (0, 999)),  # Suffix longer than the file
+        ("bytes=900-5000", (900, 999)),  # End clamped to the file
+        ("bytes=999-999", (999, 999)),
+        ("BYTES = 10-19", (10, 19)),
+    ],
+)
+def test_satisfiable_ranges(header, expected):
+    assert parse_range(header, FILE_SIZE) == expected
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        None,
+        "",
+        "bytes=0-10,20-30",  # Multiple ranges
+        "bytes=5-3",  # Last position before first
+        "items=0-10",
+        "bytes=abc",
+        "bytes=a-b",
+        "bytes=-",
+        "bytes=--5",
+        "bytes=+1-5",
+        "bytes=1--5",
+    ],
+)
+def test_ignored_ranges(header):
+    assert parse_range(header, FILE_SIZE) is None
+
+
+def test_empty_file_ignores_range():
+    assert parse_range("bytes=0-10", 0) is None
+
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=5000-6000", "bytes=-0"])
+def test_unsatisfiable_ranges(header):
+    with pytest.raises(HTTPException) as exc_info:
+        parse_range(header, FILE_SIZE)
+    assert exc_info.value.status_code == 416
+    assert exc_info.value.headers == {"Content-Range": f"bytes */{FILE_SIZE}"}
@@ -0,0 +1,218 @@
+import asyncio
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+import app.main
+from app.main import GridFSMultipartUpload, upload_file
+
+BOUNDARY = "testboundary"
+
+
+class FakeGridIn:
+    def __init__(self, filename):
+        self._id = ObjectId()
+        self.filename = filename
+        self.data = bytearray()
+        self.writes = []
+        self.fields = {}
+        self.closed = False
+        self.aborted = False
+
+    async def write(self, data):
+        self.writes.append(len(data))
+        self.data += data
+
+    async def set(self, name, value):
+        self.fields[name] = value
+
+    async def close(self):
+        self.closed = True
+
+    async def abort(self):
+        self.aborted = True
+
+
+class FakeBucket:
+    def __init__(self):
+        self.uploads = []
+
+    def open_upload_stream(self, filename, chunk_size_bytes=None):
+        grid_in = FakeGridIn(filename)
+        self.uploads.append(grid_in)
+        return grid_in
+
+
+class FakeRequest:
+    def __init__(self, body, content_type=f"multipart/form-data; boundary={BOUNDARY}", chunk_size=7):
+        self.headers = {"content-type": content_type}
+        self.body = body
+        self.chunk_size = chunk_size
+
+    async def stream(self):
+        for i in range(0, len(self.body), self.chunk_size):
+            yield self.body[i:i + self.chunk_size]
+
+
+@pytest.fixture
+def bucket(monkeypatch):
+    bucket = FakeBucket()
+    monkeypatch.setattr(app.main, "gridfs_bucket", bucket)
+    return bucket
+
+
+def field_part(name, value):
+    return (
+        f"--{BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+        f"{value}\r\n"
+    ).encode()
+
+
+def file_part(name, filename, content_type, data):
+    return (
+        f"--{BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode() + data + b"\r\n"
+
+
+def multipart(*parts):
+    return b"".join(parts) + f"--{BOUNDARY}--\r\n".encode()
+
+
+FILE_DATA = bytes(range(256)) * 40
+
+
+@pytest.mark.parametrize("fields_first", [True, False])
+def test_upload_collects_fields_around_the_file(bucket, fields_first):
+    fields = [field_part("owner_id", "user1"), field_part("tags", "a, b"), field_part("description", "hi")]
+    file = file_part("file", "photo.png", "image/png", FILE_DATA)
+    body = multipart(*(fields + [file] if fields_first else [file] + fields))
+
+    response = asyncio.run(upload_file(FakeRequest(body)))
+
+    [grid_in] = bucket.uploads
+    assert grid_in.filename == "photo.png"
+    assert bytes(grid_in.data) == FILE_DATA
+    assert grid_in.closed and not grid_in.aborted
+    assert grid_in.fields["owner_id"] == "user1"
+    assert grid_in.fields["tags"] == ["a", "b"]
+    assert grid_in.fields["description"] == "hi"
+    assert grid_in.fields["contentType"] == "image/png"
+    assert grid_in.fields["metadata"]["owner_id"] == "user1"
+    assert response.file_id == str(grid_in._id)
+    assert response.file_size == len(FILE_DATA)
+    assert response.owner_id == "user1"
+
+
+def test_file_data_is_written_in_gridfs_sized_batches(bucket, monkeypatch):
+    monkeypatch.setattr(app.main, "GRIDFS_CHUNK_BYTES", 1024)
+    body = multipart(file_part("file", "photo.png", "image/png", FILE_DATA))
+    upload = GridFSMultipartUpload(FakeRequest(body, chunk_size=100), "test")
+    asyncio.run(upload.parse())
+
+    [grid_in] = bucket.uploads
+    assert bytes(grid_in.data) == FILE_DATA
+    # One write per 1 KiB batch, not one per 100 byte body message
+    assert len(grid_in.writes) <= len(FILE_DATA) // 1024 + 1
+    assert all(size >= 1024 for size in grid_in.writes[:-1])
+
+
+def test_unknown_fields_are_not_collected(bucket):
+    body = multipart(
+        field_part("other", "x" * (GridFSMultipartUpload.max_field_size + 1)),
+        file_part("file", "clip.mp4", "video/mp4", b"data"),
+    )
+    upload = GridFSMultipartUpload(FakeRequest(body, chunk_size=4096), "test")
+    asyncio.run(upload.parse())
+
+    assert upload.fields == {}
+    assert bytes(bucket.uploads[0].data) == b"data"
+
+
+def test_oversized_field_is_rejected(bucket):
+    body = multipart(field_part("description", "x" * (GridFSMultipartUpload.max_field_size + 1)))
+    upload = GridFSMultipartUpload(FakeRequest(body, chunk_size=4096), "test")
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(upload.parse())
+    assert exc_info.value.status_code == 400
+
+
+def test_other_file_parts_are_ignored(bucket):
+    body = multipart(
+        file_part("thumbnail", "thumb.png", "image/png", b"thumb"),
+        file_part("file", "photo.png", "image/png", b"photo"),
+    )
+    upload = GridFSMultipartUpload(FakeRequest(body), "test")
+    asyncio.run(upload.parse())
+
+    [grid_in] = bucket.uploads
+    assert bytes(grid_in.data) == b"photo"
+
+
+def test_two_file_parts_are_rejected(bucket):
+    body = multipart(
+        file_part("file", "one.png", "image/png", b"one"),
+        file_part("file", "two.png", "image/png", b"two"),
+    )
+    upload = GridFSMultipartUpload(FakeRequest(body), "test")
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(upload.parse())
+    assert exc_info.value.status_code == 400
+    [grid_in] = bucket.uploads
+    assert grid_in.aborted and not grid_in.closed
+
+
+def test_non_media_file_is_rejected(bucket):
+    body = multipart(file_part("file", "notes.txt", "text/plain", b"text"))
+    upload = GridFSMultipartUpload(FakeRequest(body), "test")
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(upload.parse())
+    assert exc_info.value.status_code == 400
+    assert bucket.uploads == []
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    ["application/json", "application/x-www-form-urlencoded", "multipart/form-data", ""],
+)
+def test_wrong_request_content_type_is_rejected(bucket, content_type):
+    upload = GridFSMultipartUpload(FakeRequest(b"{}", content_type=content_type), "test")
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(upload.parse())
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        file_part("file", "photo.png", "image/png", FILE_DATA) + b"--wrongboundary--\r\n",
+        multipart(file_part("file", "photo.png", "image/png", FILE_DATA))[:-100],  # Truncated
+        multipart(file_part("file", "photo.png", "image/png", FILE_DATA)).replace(
+            b"\r\n\r\n", b"\r\nbroken header\r\n\r\n", 1
+        ),
+    ],
+    ids=["wrong-boundary", "truncated", "bad-header"],
+)
+def test_malformed_body_aborts_the_upload(bucket, body):
+    upload = GridFSMultipartUpload(FakeRequest(body), "test")
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(upload.parse())
+    assert exc_info.value.status_code == 400
+    assert all(grid_in.aborted and not grid_in.closed for grid_in in bucket.uploads)
+
+
+def test_missing_file_is_rejected(bucket):
+    body = multipart(field_part("owner_id", "user1"))
+    upload = GridFSMultipartUpload(FakeRequest(body), "test")
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(upload.parse())
+    assert exc_info.value.status_code == 422